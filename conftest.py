@@ -0,0 +1,62 @@
+"""Shared pytest fixtures: a fake YOLO model, so detector tests run without ultralytics, torch or OpenCV"""
+
+import threading
+
+import numpy as np
+import pytest
+
+
+class FakeTensor:
+    """Enough of a torch tensor for the result converters"""
+
+    def __init__(self, array):
+        self.array = array
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.array
+
+
+class FakeBoxes:
+    """One detection: x1, y1, x2, y2, conf, cls"""
+
+    def __init__(self):
+        self.data = FakeTensor(np.array([[10, 20, 110, 220, 0.9, 0]], dtype=np.float32))
+        self.xyxy = FakeTensor(self.data.array[:, :4])
+        self.conf = FakeTensor(self.data.array[:, 4])
+        self.cls = FakeTensor(self.data.array[:, 5])
+
+    def __len__(self):
+        return 1
+
+
+class FakeResult:
+    def __init__(self):
+        self.boxes = FakeBoxes()
+
+    def cpu(self):
+        return self
+
+
+class FakeModel:
+    """Callable like ultralytics YOLO; records (batch size, thread) per call, raises while `fail` is set"""
+
+    def __init__(self):
+        self.calls = []
+        self.fail = False
+
+    def __call__(self, images, **kwargs):
+        self.calls.append((len(images), threading.current_thread().name))
+        if self.fail:
+            raise RuntimeError("inference failed")
+        return [FakeResult() for _ in images]
+
+    predict = __call__
+
+
+@pytest.fixture
+def fake_model():
+    """A fresh fake YOLO model to assign onto a detector"""
+    return FakeModel()
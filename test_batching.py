@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""Dynamic batching tests: concurrent requests share one model call, model errors reach every caller
+
+The detectors get a fake YOLO model object, so these run without ultralytics, torch or OpenCV.
+"""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+import tire_detection_system
+import tire_detection_system_backup
+import tire_detection_system_honest
+
+
+def blank_image():
+    return np.zeros((64, 64, 3), dtype=np.uint8)
+
+
+def test_main_detector_batches_concurrent_requests(monkeypatch, fake_model):
+    """tire_detection_system: concurrent _infer calls run as one model call on the inference thread"""
+    monkeypatch.setattr(tire_detection_system.config, "preallocate_cpu_buffers", False)
+    detector = tire_detection_system.HybridTireDetector(device="cpu")
+    detector.model = fake_model
+    detector.model_loaded = True
+
+    async def run():
+        detector.start_batching()
+        try:
+            results = await asyncio.gather(*(detector._infer(blank_image()) for _ in range(4)))
+        finally:
+            await detector.stop_batching()
+        return results
+
+    results = asyncio.run(run())
+
+    assert detector.model.calls == [(4, "yolo-cpu_0")]
+    assert [len(detector._convert_yolo_results(result)) for result in results] == [1, 1, 1, 1]
+
+
+def test_main_detector_model_error_reaches_every_request(monkeypatch, fake_model):
+    """tire_detection_system: a failed batch raises in each waiting request and the worker keeps going"""
+    monkeypatch.setattr(tire_detection_system.config, "preallocate_cpu_buffers", False)
+    detector = tire_detection_system.HybridTireDetector(device="cpu")
+    detector.model = fake_model
+    detector.model_loaded = True
+
+    async def run():
+        detector.start_batching()
+        try:
+            detector.model.fail = True
+            failed = await asyncio.gather(*(detector._infer(blank_image()) for _ in range(3)),
+                                          return_exceptions=True)
+            detector.model.fail = False
+            recovered = await detector._infer(blank_image())
+        finally:
+            await detector.stop_batching()
+        return failed, recovered
+
+    failed, recovered = asyncio.run(run())
+
+    assert all(isinstance(error, RuntimeError) for error in failed)
+    assert len(recovered) == 1
+
+
+def test_backup_detector_batches_concurrent_requests(fake_model):
+    """tire_detection_system_backup: concurrent analyses share one predict call on the yolo thread"""
+    detector = tire_detection_system_backup.HybridTireDetector()
+    detector.is_initialized = True
+    detector.real_ai_available = True
+    detector.yolo_model = fake_model
+
+    async def run():
+        try:
+            return await asyncio.gather(*(
+                detector.analyze_tire_image(blank_image(), f"image_{i}") for i in range(5)
+            ))
+        finally:
+            await detector.shutdown()
+
+    results = asyncio.run(run())
+
+    assert detector.yolo_model.calls == [(5, "yolo_0")]
+    assert [result.image_id for result in results] == [f"image_{i}" for i in range(5)]
+    assert all(result.metadata["processing_mode"] == "real_ai" for result in results)
+    assert all(len(result.defects_found) == 1 for result in results)
+
+
+def test_backup_detector_model_error_is_raised_not_simulated(fake_model):
+    """tire_detection_system_backup: inference errors on real images propagate instead of fake defects"""
+    detector = tire_detection_system_backup.HybridTireDetector()
+    detector.is_initialized = True
+    detector.real_ai_available = True
+    detector.yolo_model = fake_model
+    detector.yolo_model.fail = True
+
+    async def run():
+        try:
+            await detector.analyze_tire_image(blank_image())
+        finally:
+            await detector.shutdown()
+
+    with pytest.raises(RuntimeError, match="inference failed"):
+        asyncio.run(run())
+
+
+def test_honest_detector_batches_concurrent_requests(fake_model):
+    """tire_detection_system_honest: concurrent uploads run as one _run_model call"""
+    detector = tire_detection_system_honest.HonestEdgeAIDetector()
+    detector.is_initialized = True
+    detector.yolo_loaded = True
+    detector.model = fake_model
+    detector._decode_image = lambda image_data: (blank_image(), None)
+
+    async def run():
+        try:
+            return await asyncio.gather(*(detector.analyze_image(b"upload", f"image_{i}") for i in range(3)))
+        finally:
+            await detector.shutdown()
+
+    results = asyncio.run(run())
+
+    assert detector.model.calls == [(3, "yolo_0")]
+    assert [result.image_id for result in results] == [f"image_{i}" for i in range(3)]
+    assert all(result.detections[0]["note"] == "General object detection - Class ID 0" for result in results)
+
+
+def test_honest_detector_model_error_falls_back_per_request(fake_model):
+    """tire_detection_system_honest: a failed batch answers every request from the simulation"""
+    detector = tire_detection_system_honest.HonestEdgeAIDetector()
+    detector.is_initialized = True
+    detector.yolo_loaded = True
+    detector.model = fake_model
+    detector.model.fail = True
+    detector._decode_image = lambda image_data: (blank_image(), None)
+
+    async def run():
+        try:
+            return await asyncio.gather(*(detector.analyze_image(b"upload", f"image_{i}") for i in range(3)))
+        finally:
+            await detector.shutdown()
+
+    results = asyncio.run(run())
+
+    assert len(detector.model.calls) == 1
+    assert all(result.image_id.startswith("demo_") for result in results)
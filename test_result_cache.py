@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""Upload result cache tests: byte-identical re-uploads replay real-model results, never simulations"""
+
+from collections import OrderedDict
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+import tire_detection_system
+import tire_detection_system_backup
+from api import fastapi_backend
+
+PNG_HEADER = b"\x89PNG\r\n\x1a\n" + bytes(16)
+
+
+def backup_upload(client, data):
+    return client.post("/analyze", files={"image": ("tire.png", data, "image/png")})
+
+
+def test_backup_cache_replays_real_results_under_new_id(monkeypatch, fake_model):
+    """tire_detection_system_backup /analyze: a repeat upload skips the model and gets its own id"""
+    monkeypatch.setattr(tire_detection_system_backup, "_result_cache", OrderedDict())
+    with TestClient(tire_detection_system_backup.app) as client:
+        detector = tire_detection_system_backup.detector
+        detector.yolo_model = fake_model
+        detector.real_ai_available = True
+        detector._decode_image = lambda image_data: (np.zeros((64, 64, 3), dtype=np.uint8), 1.0)
+
+        first = backup_upload(client, PNG_HEADER + b"same").json()
+        second = backup_upload(client, PNG_HEADER + b"same").json()
+        other = backup_upload(client, PNG_HEADER + b"other").json()
+
+    assert len(fake_model.calls) == 2
+    assert first["metadata"]["processing_mode"] == "real_ai"
+    assert second["image_id"] != first["image_id"]
+    assert second["defects_found"] == first["defects_found"]
+    assert other["image_id"] not in (first["image_id"], second["image_id"])
+    assert len(tire_detection_system_backup._result_cache) == 2
+
+
+def test_backup_cache_skips_simulated_results(monkeypatch):
+    """tire_detection_system_backup /analyze: simulation output is never replayed"""
+    monkeypatch.setattr(tire_detection_system_backup, "_result_cache", OrderedDict())
+    with TestClient(tire_detection_system_backup.app) as client:
+        for _ in range(2):
+            assert backup_upload(client, PNG_HEADER + b"same").status_code == 200
+
+    assert len(tire_detection_system_backup._result_cache) == 0
+
+
+def fake_analysis(calls, processing_mode):
+    """Stand-in for HybridTireDetector.analyze_tire_image returning a result in the given mode"""
+    async def analyze_tire_image(self, image_data=None, image_id=None):
+        calls.append(image_id)
+        if processing_mode == fastapi_backend.REAL_MODEL_MODE:
+            return await self._generate_yolo_style_results([], image_id or "tire_analysis", 0.01)
+        return await self.generate_simulation_result()
+    return analyze_tire_image
+
+
+def backend_upload(client, data, image_id):
+    return client.post(
+        "/analyze",
+        data={"image_id": image_id},
+        files={"file": ("tire.png", data, "image/png")},
+        headers={"Authorization": "Bearer token"},
+    )
+
+
+def test_backend_cache_replays_real_results_under_request_id(monkeypatch):
+    """api/fastapi_backend /analyze: a repeat upload skips the detector and keeps the request's image_id"""
+    calls = []
+    monkeypatch.setattr(fastapi_backend, "_result_cache", OrderedDict())
+    monkeypatch.setattr(tire_detection_system.HybridTireDetector, "analyze_tire_image",
+                        fake_analysis(calls, fastapi_backend.REAL_MODEL_MODE))
+    with TestClient(fastapi_backend.create_enterprise_api()) as client:
+        first = backend_upload(client, PNG_HEADER + b"same", "first").json()
+        second = backend_upload(client, PNG_HEADER + b"same", "second").json()
+
+    assert calls == ["first"]
+    assert (first["image_id"], second["image_id"]) == ("first", "second")
+    assert second["quality_score"] == first["quality_score"]
+
+
+def test_backend_cache_skips_simulated_results(monkeypatch):
+    """api/fastapi_backend /analyze: simulation output is never replayed"""
+    calls = []
+    monkeypatch.setattr(fastapi_backend, "_result_cache", OrderedDict())
+    monkeypatch.setattr(tire_detection_system.HybridTireDetector, "analyze_tire_image",
+                        fake_analysis(calls, "simulation"))
+    with TestClient(fastapi_backend.create_enterprise_api()) as client:
+        for image_id in ("first", "second"):
+            assert backend_upload(client, PNG_HEADER + b"same", image_id).status_code == 200
+
+    assert calls == ["first", "second"]
+    assert len(fastapi_backend._result_cache) == 0
+
+
+def test_backend_cache_replay_without_image_id_gets_a_new_id(monkeypatch):
+    """api/fastapi_backend /analyze: a replay with no image_id does not reuse the original's id"""
+    calls = []
+    monkeypatch.setattr(fastapi_backend, "_result_cache", OrderedDict())
+    monkeypatch.setattr(tire_detection_system.HybridTireDetector, "analyze_tire_image",
+                        fake_analysis(calls, fastapi_backend.REAL_MODEL_MODE))
+    with TestClient(fastapi_backend.create_enterprise_api()) as client:
+        ids = [
+            client.post(
+                "/analyze",
+                files={"file": ("tire.png", PNG_HEADER + b"same", "image/png")},
+                headers={"Authorization": "Bearer token"},
+            ).json()["image_id"]
+            for _ in range(3)
+        ]
+
+    assert len(calls) == 1
+    assert len(set(ids)) == 3
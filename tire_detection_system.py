@@ -32,6 +32,13 @@ import sys
 import time
 import asyncio
 import random
+import hashlib
+import shutil
+import importlib.util
+import logging
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from datetime import datetime
 from contextlib import asynccontextmanager
 from typing import List, Optional, Any, Dict
@@ -39,7 +46,7 @@ from dataclasses import dataclass, field
 
 # FastAPI and related imports
 from fastapi import FastAPI, HTTPException, UploadFile, File, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 # Core dependencies
@@ -50,14 +57,33 @@ try:
 except ImportError:
     OPENCV_AVAILABLE = False
 
-# YOLOv8 integration (disabled due to import issues in some environments)
-YOLO_AVAILABLE = False
-# Uncomment below to enable YOLO when environment supports it:
-# try:
-#     from ultralytics import YOLO
-#     YOLO_AVAILABLE = True
-# except ImportError:
-#     YOLO_AVAILABLE = False
+# msgspec JSON encoder (optional) - C encoder for analysis responses
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# Numba JIT (optional) - only pays off for large defect batches
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# torchvision nvJPEG decode (optional) - decodes JPEGs straight into GPU memory
+TORCHVISION_AVAILABLE = importlib.util.find_spec("torchvision") is not None
+
+# YOLOv8 integration (optional - simulation fallback when ultralytics is missing or fails to import)
+YOLO = None
+try:
+    from ultralytics import YOLO
+    YOLO_AVAILABLE = True
+except ImportError:
+    YOLO_AVAILABLE = False
+except Exception as e:
+    print(f"⚠️ YOLOv8 import issue, using simulation mode: {e}")
+    YOLO_AVAILABLE = False
 
 
 # ==================== PRODUCTION CONFIGURATION ====================
@@ -75,11 +101,30 @@ class ProductionDemoConfig:
     confidence_threshold: float = 0.5
     model_path: str = "yolov8n.pt"  # Pre-trained general model
     device: str = "cpu"  # Auto-detect in production
+    input_size: int = 640  # Letterbox size for preallocated GPU input buffers
+    preallocate_gpu_buffers: bool = True  # Reuse pinned/device input buffers on cuda
+    preallocate_cpu_buffers: bool = True  # Letterbox + normalize CPU batches into reused buffers
+    fast_cuda_math: bool = True  # TF32 matmul/conv + cuDNN autotuning for the fixed input size
+    export_runtime: bool = True  # Export to TensorRT (cuda) / OpenVINO (cpu) on startup
+    export_dir: str = "models"  # Exported engines cached here, keyed by weights hash
+    # Dataset yaml for OpenVINO INT8 calibration; unset exports FP16 instead of downloading a default set
+    int8_calibration_data: Optional[str] = os.environ.get("EDGE_INT8_CALIBRATION_DATA")
+    int8_calibration_fraction: float = float(os.environ.get("EDGE_INT8_CALIBRATION_FRACTION", "1.0"))
     
     # Processing settings
     min_processing_time: float = 0.08
     max_processing_time: float = 0.15
     
+    # Dynamic batching for concurrent /analyze requests (real YOLO path)
+    max_batch_size: int = 8
+    max_batch_wait: float = 0.05  # Seconds to wait for a batch to fill
+    target_batch_latency: float = 0.25  # Shrink batches when inference exceeds this
+    request_sla: float = 2.0  # Reject with 429 when the queue cannot drain within this
+    
+    # Upload handling
+    max_upload_bytes: int = 10 * 1024 * 1024  # Reject larger uploads with 413
+    upload_chunk_size: int = 64 * 1024
+    
     # Demo scenarios for reliable presentations
     demo_scenarios: Dict[str, Dict] = field(default_factory=lambda: {
         "excellent": {
@@ -145,27 +190,95 @@ class ProductionDemoConfig:
 # Global configuration instance
 config = ProductionDemoConfig()
 
+# Quality-score bands shared by result construction and business impact
+QUALITY_THRESHOLDS = (60, 75, 90)
+QUALITY_LABELS = ("poor", "fair", "good", "excellent")
+
+def classify_quality(quality_score: float) -> str:
+    """Map a quality score to its overall quality label"""
+    return QUALITY_LABELS[bisect_right(QUALITY_THRESHOLDS, quality_score)]
+
+# Shared RNG for demo variation (no per-call imports or global-state lookups)
+_rng = random.Random()
+
+# Weighted random scenario pool (bias toward good outcomes for realism)
+_WEIGHTED_SCENARIOS = ("excellent", "good", "good", "good", "concerning", "critical")
+
+# Request-path logging (level-gated; startup banners stay on print)
+log = logging.getLogger("rubicon")
+
+# Severity encoding for array-based scoring (index 3 = unrecognised severity)
+SEVERITY_CODES = {"low": 0, "medium": 1, "high": 2}
+# Industry-standard severity impact matrix: low, medium, high, unrecognised
+SEVERITY_DEDUCTIONS = (5.0, 15.0, 30.0, 10.0)
+SEVERITY_DEDUCTIONS_ARR = np.array(SEVERITY_DEDUCTIONS)
+NUMBA_MIN_DEFECTS = 256  # Below this the Python loop is faster than building arrays
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _score_arr(arr, deductions):
+        """Total size-weighted deduction over an (n, 2) [severity_code, area] array"""
+        total = 0.0
+        for i in range(arr.shape[0]):
+            size_factor = min(arr[i, 1] / 5000.0, 1.5)
+            total += deductions[int(arr[i, 0])] * (1.0 + size_factor * 0.3)
+        return total
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _letterbox_kernel(bgr, canvas, pad_x, pad_y, new_w, new_h):
+        """Bilinear resize + BGR->RGB + 114 padding into canvas in one pass over target pixels"""
+        size = canvas.shape[0]
+        src_h, src_w = bgr.shape[0], bgr.shape[1]
+        inv_x, inv_y = src_w / new_w, src_h / new_h  # per-axis, as cv2.resize samples
+        for y in prange(size):
+            for x in range(size):
+                if y < pad_y or y >= pad_y + new_h or x < pad_x or x >= pad_x + new_w:
+                    canvas[y, x, 0] = 114
+                    canvas[y, x, 1] = 114
+                    canvas[y, x, 2] = 114
+                    continue
+                sy = min(max((y - pad_y + 0.5) * inv_y - 0.5, 0.0), src_h - 1.0)
+                sx = min(max((x - pad_x + 0.5) * inv_x - 0.5, 0.0), src_w - 1.0)
+                y0, x0 = int(sy), int(sx)
+                y1, x1 = min(y0 + 1, src_h - 1), min(x0 + 1, src_w - 1)
+                fy, fx = sy - y0, sx - x0
+                for c in range(3):
+                    top = bgr[y0, x0, c] * (1.0 - fx) + bgr[y0, x1, c] * fx
+                    bottom = bgr[y1, x0, c] * (1.0 - fx) + bgr[y1, x1, c] * fx
+                    canvas[y, x, 2 - c] = np.uint8(top * (1.0 - fy) + bottom * fy + 0.5)
+
 # =============================================================================
 # PROFESSIONAL DATA MODELS
 # =============================================================================
 
+@dataclass(slots=True)
 class DefectResult:
     """Professional defect detection result with enterprise validation"""
     
-    def __init__(self, defect_type: str, confidence: float, bbox: List[int], 
-                 severity: str, description: str):
-        self.defect_type = defect_type
-        self.confidence = confidence
-        self.bbox = bbox
-        self.severity = severity
-        self.description = description
-        
+    defect_type: str
+    confidence: float
+    bbox: List[int]
+    severity: str
+    description: str
+    area: float = field(init=False)
+    
+    def __post_init__(self):
         # Calculate area from bounding box
+        bbox = self.bbox
         if len(bbox) >= 4:
             self.area = (bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
         else:
             self.area = 0
 
+# Business impact bands: (risk_level, replacement_recommended, remaining_life, maintenance_priority)
+CRITICAL_IMPACT = ("critical", True, "0-7 days", "immediate")
+IMPACT_THRESHOLDS = (60, 75)
+IMPACT_BANDS = (
+    ("high", True, "1-4 weeks", "urgent"),
+    ("medium", False, "2-6 months", "scheduled"),
+    ("low", False, "6+ months", "routine"),
+)
+
 class TireAnalysisResult(BaseModel):
     """Comprehensive tire analysis result for enterprise use"""
     
@@ -201,7 +314,8 @@ class TireAnalysisResult(BaseModel):
         # Calculate business impact
         business_impact = cls._calculate_business_impact(defects_found, quality_score)
         
-        return cls(
+        # Fields are built internally, so skip Pydantic validation
+        return cls.model_construct(
             image_id=image_id,
             processing_time=processing_time,
             defects_found=defects_dict,
@@ -219,25 +333,10 @@ class TireAnalysisResult(BaseModel):
         high_severity_count = sum(1 for d in defects_found if d.severity == "high")
         
         if high_severity_count > 0:
-            risk_level = "critical"
-            replacement_recommended = True
-            estimated_remaining_life = "0-7 days"
-            maintenance_priority = "immediate"
-        elif quality_score < 60:
-            risk_level = "high"
-            replacement_recommended = True
-            estimated_remaining_life = "1-4 weeks"
-            maintenance_priority = "urgent"
-        elif quality_score < 75:
-            risk_level = "medium"
-            replacement_recommended = False
-            estimated_remaining_life = "2-6 months"
-            maintenance_priority = "scheduled"
+            risk_level, replacement_recommended, estimated_remaining_life, maintenance_priority = CRITICAL_IMPACT
         else:
-            risk_level = "low"
-            replacement_recommended = False
-            estimated_remaining_life = "6+ months"
-            maintenance_priority = "routine"
+            risk_level, replacement_recommended, estimated_remaining_life, maintenance_priority = \
+                IMPACT_BANDS[bisect_right(IMPACT_THRESHOLDS, quality_score)]
         
         return {
             "risk_level": risk_level,
@@ -249,6 +348,52 @@ class TireAnalysisResult(BaseModel):
 
 # ==================== HYBRID TIRE DETECTOR ====================
 
+def letterbox_tensor_into(chw_rgb: Any, out: Any):
+    """Letterbox a GPU CHW uint8 RGB tensor into a normalized CHW slot, returning (scale, pad_x, pad_y)"""
+    import torch.nn.functional as F
+    
+    size = out.shape[-1]
+    h, w = chw_rgb.shape[1:]
+    scale = min(size / h, size / w)
+    new_w, new_h = round(w * scale), round(h * scale)
+    pad_x, pad_y = (size - new_w) // 2, (size - new_h) // 2
+    
+    resized = F.interpolate(chw_rgb.unsqueeze(0).to(out.dtype), size=(new_h, new_w),
+                            mode="bilinear", align_corners=False)[0]
+    out.fill_(114 / 255.0)
+    out[:, pad_y:pad_y + new_h, pad_x:pad_x + new_w] = resized / 255.0
+    return scale, pad_x, pad_y
+
+
+def letterbox_into(image: np.ndarray, canvas: np.ndarray):
+    """Resize a BGR image into a square RGB canvas (padded with 114), returning (scale, pad_x, pad_y)"""
+    size = canvas.shape[0]
+    h, w = image.shape[:2]
+    scale = min(size / h, size / w)
+    new_w, new_h = round(w * scale), round(h * scale)
+    pad_x, pad_y = (size - new_w) // 2, (size - new_h) // 2
+    
+    if NUMBA_AVAILABLE:
+        # Fused resize/pad/channel-swap straight into the (pinned) canvas, no temporaries
+        _letterbox_kernel(image, canvas, pad_x, pad_y, new_w, new_h)
+        return scale, pad_x, pad_y
+    
+    canvas.fill(114)
+    resized = cv2.resize(image, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+    canvas[pad_y:pad_y + new_h, pad_x:pad_x + new_w] = resized[..., ::-1]
+    return scale, pad_x, pad_y
+
+
+# General COCO class mapping (replace with tire-specific classes)
+COCO_TO_DEFECT = {
+    0: "foreign_object",  # person -> foreign object
+    2: "wear_pattern",    # car -> wear pattern  
+    7: "puncture",        # truck -> puncture
+    # Add your tire-specific class mappings here
+}
+UNKNOWN_DEFECT = "unknown_defect"
+COCO_CLASS_COUNT = 80
+
 class HybridTireDetector:
     """
     Hybrid tire detection system with real YOLOv8 integration + simulation fallback
@@ -257,12 +402,38 @@ class HybridTireDetector:
     Replace with your tire-specific trained models for production.
     """
     
-    def __init__(self):
+    def __init__(self, device: Optional[str] = None):
+        self.device = device or config.device  # One detector per GPU in multi-GPU serving
         self.model = None
         self.model_loaded = False
+        self.exported_runtime = False  # True once an exported engine replaces the .pt model
         self.is_initialized = False
         self.demo_mode = not YOLO_AVAILABLE  # Use demo if YOLO not available
         
+        # CUDA stream and staging buffers, created lazily and only touched by the inference thread
+        self._stream = None
+        self._host_buffer = None  # Pinned (max_batch, size, size, 3) uint8 upload buffer
+        self._device_u8 = None
+        self._device_input = None  # (max_batch, 3, size, size) fp16 model input
+        self._cpu_u8 = None
+        self._cpu_input = None  # (max_batch, 3, size, size) float32 model input on CPU
+        
+        # One inference thread per detector: the model is not thread-safe, and a bounded pool
+        # keeps inference off the shared default executor (which oversubscribes the cores)
+        self._infer_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"yolo-{self.device}")
+        
+        # Dynamic batching state (started from the API lifespan)
+        self._batch_queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        self._batch_size = config.max_batch_size
+        self._batch_latency = 0.0
+        
+        # Class-id -> defect-name lookup table for vectorized result conversion
+        self._defect_names = tuple(dict.fromkeys(COCO_TO_DEFECT.values())) + (UNKNOWN_DEFECT,)
+        self._defect_lut = np.full(COCO_CLASS_COUNT, len(self._defect_names) - 1, dtype=np.int8)
+        for class_id, defect_type in COCO_TO_DEFECT.items():
+            self._defect_lut[class_id] = self._defect_names.index(defect_type)
+        
     async def initialize(self):
         """Initialize the hybrid detection system"""
         try:
@@ -275,6 +446,7 @@ class HybridTireDetector:
                     print("✅ Real YOLOv8 model loaded successfully")
                     self.model_loaded = True
                     self.demo_mode = False
+                    await asyncio.get_running_loop().run_in_executor(self._infer_pool, self._warmup)
                 else:
                     print("⚠️ YOLO model loading failed - using simulation mode")
                     self.demo_mode = True
@@ -282,6 +454,11 @@ class HybridTireDetector:
                 print("ℹ️ YOLOv8 not available - using simulation mode")
                 self.demo_mode = True
             
+            if NUMBA_AVAILABLE:
+                # Compile the scoring kernel now rather than on the first large batch
+                _score_arr(np.zeros((1, 2), dtype=np.float32), SEVERITY_DEDUCTIONS_ARR)
+                letterbox_into(np.zeros((2, 2, 3), dtype=np.uint8), np.empty((4, 4, 3), dtype=np.uint8))
+            
             self.is_initialized = True
             mode = "simulation" if self.demo_mode else "hybrid (real YOLO + simulation)"
             print(f"✅ System initialized in {mode} mode")
@@ -302,12 +479,18 @@ class HybridTireDetector:
             
             print("🤖 Loading YOLOv8 model...")
             
-            # Import YOLO here to avoid module-level import issues
-            from ultralytics import YOLO
-            
             # Load pre-trained YOLO model (general object detection)
             self.model = YOLO(config.model_path)
             
+            # Swap to an accelerated runtime when one is available
+            if config.export_runtime:
+                loop = asyncio.get_running_loop()
+                exported_path = await loop.run_in_executor(None, self._export_accelerated_model)
+                if exported_path:
+                    self.model = YOLO(exported_path, task="detect")
+                    self.exported_runtime = True
+                    print(f"⚡ Using exported runtime: {exported_path}")
+            
             # For production: Replace with tire-specific model
             # self.model = YOLO("tire_defect_model.pt")
             
@@ -318,6 +501,242 @@ class HybridTireDetector:
             print(f"⚠️ YOLO model loading failed: {e}")
             return False
     
+    def _export_accelerated_model(self) -> Optional[str]:
+        """Export the .pt weights once per (weights hash, device, format) and return the cached artifact"""
+        weights = Path(config.model_path)
+        if not weights.exists():
+            return None
+        
+        if self.device.startswith("cuda"):
+            export_format = "engine"
+            # nms=True bakes NMS into the engine so it runs fused on the GPU
+            export_args = {"half": True, "dynamic": True, "batch": config.max_batch_size,
+                           "device": self.device, "nms": True, "simplify": True}
+        elif importlib.util.find_spec("openvino") is not None:
+            export_format = "openvino"
+            # Dynamic batch so the batcher's full batches fit; INT8 only with a configured calibration set
+            export_args = {"dynamic": True, "batch": config.max_batch_size}
+            if config.int8_calibration_data:
+                export_args.update(int8=True, data=config.int8_calibration_data,
+                                   fraction=config.int8_calibration_fraction)
+            else:
+                export_args["half"] = True
+        else:
+            return None
+        
+        digest = hashlib.sha256(weights.read_bytes()).hexdigest()[:12]
+        variant = "nms" if export_args.get("nms") else ("int8" if export_args.get("int8") else "fp16")
+        cache_dir = Path(config.export_dir) / f"{weights.stem}_{digest}_{self.device}_{export_format}_{variant}"
+        if cache_dir.exists():
+            cached = next(cache_dir.iterdir(), None)
+            if cached is not None:
+                return str(cached)
+        
+        try:
+            print(f"⚙️ Exporting YOLOv8 to {export_format} (one-time, cached in {cache_dir})...")
+            exported = Path(self.model.export(format=export_format, **export_args))
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            target = cache_dir / exported.name
+            shutil.move(str(exported), str(target))
+            return str(target)
+        except Exception as e:
+            print(f"⚠️ Runtime export failed, keeping PyTorch model: {e}")
+            return None
+    
+    def _warmup(self):
+        """Run dummy batches on the inference thread so the first request skips cold start
+        
+        This pays for cuDNN autotuning, engine context setup and the lazily created
+        pinned/device staging buffers up front.
+        """
+        try:
+            dummy = np.zeros((config.input_size, config.input_size, 3), dtype=np.uint8)
+            for batch_size in (1, config.max_batch_size, config.max_batch_size):
+                self._run_model([dummy] * batch_size)
+            print(f"🔥 Detector warmed up on {self.device}")
+        except Exception as e:
+            print(f"⚠️ Warmup skipped: {e}")
+    
+    def start_batching(self):
+        """Start the background worker that coalesces concurrent YOLO requests"""
+        if self._batch_task is None and self.model_loaded:
+            self._batch_queue = asyncio.Queue()
+            self._batch_task = asyncio.create_task(self._batch_worker())
+            print(f"📦 Dynamic batching enabled (max {config.max_batch_size} images / {config.max_batch_wait*1000:.0f}ms)")
+    
+    async def stop_batching(self):
+        """Stop the batching worker"""
+        if self._batch_task is not None:
+            self._batch_task.cancel()
+            try:
+                await self._batch_task
+            except asyncio.CancelledError:
+                pass
+            self._batch_task = None
+            self._batch_queue = None
+    
+    def queue_depth(self) -> int:
+        """Number of images waiting for this detector's batching worker"""
+        return self._batch_queue.qsize() if self._batch_queue is not None else 0
+    
+    def is_overloaded(self) -> bool:
+        """True when queued work cannot be drained within the request SLA"""
+        if self._batch_queue is None:
+            return False
+        pending_batches = self._batch_queue.qsize() / max(self._batch_size, 1)
+        return pending_batches * self._batch_latency > config.request_sla
+    
+    async def _batch_worker(self):
+        """Pop up to the current batch size (or until max wait), run one inference, fan out results"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._batch_queue.get()]
+            deadline = loop.time() + config.max_batch_wait
+            while len(batch) < self._batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._batch_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            images = [image for image, _ in batch]
+            start = time.perf_counter()
+            try:
+                results = await loop.run_in_executor(self._infer_pool, self._run_model, images)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result([result])
+            
+            # Adapt batch size to observed latency
+            self._batch_latency = time.perf_counter() - start
+            if self._batch_latency > config.target_batch_latency:
+                self._batch_size = max(1, self._batch_size // 2)
+            elif self._batch_latency < config.target_batch_latency / 2:
+                self._batch_size = min(config.max_batch_size, self._batch_size + 1)
+    
+    def _run_model(self, images: Any):
+        """Blocking YOLO call, made on the detector's single inference thread
+        
+        On cuda it runs on a dedicated stream ordered after the nvJPEG decodes, with batches
+        staged through preallocated buffers; one batch is in flight at a time.
+        """
+        if not self.device.startswith("cuda"):
+            batch = images if isinstance(images, list) else [images]
+            if config.preallocate_cpu_buffers and len(batch) <= config.max_batch_size:
+                inputs, letterbox = self._stage_batch_cpu(batch)
+                results = self.model(inputs, conf=config.confidence_threshold, verbose=False)
+                self._undo_letterbox(results, letterbox)
+                return results
+            return self.model(images, conf=config.confidence_threshold, verbose=False)
+        
+        import torch
+        
+        if self._stream is None:
+            self._stream = torch.cuda.Stream(device=self.device)
+        
+        batch = images if isinstance(images, list) else [images]
+        use_buffers = config.preallocate_gpu_buffers and len(batch) <= config.max_batch_size
+        # nvJPEG decodes ran on the default stream; order this stream after them
+        self._stream.wait_stream(torch.cuda.default_stream(self.device))
+        with torch.cuda.stream(self._stream):
+            if use_buffers:
+                inputs, letterbox = self._stage_batch(batch)
+            else:
+                # ultralytics wants BGR arrays for arbitrary-size inputs
+                inputs = [
+                    image.permute(1, 2, 0).flip(-1).cpu().numpy() if isinstance(image, torch.Tensor) else image
+                    for image in batch
+                ]
+                letterbox = None
+            # Plain .pt weights on GPU: run FP16 (exported engines carry their own precision)
+            results = self.model(inputs, conf=config.confidence_threshold, verbose=False,
+                                 half=not self.exported_runtime, device=self.device)
+            if letterbox is not None:
+                self._undo_letterbox(results, letterbox)
+        # Results are read on the event loop thread, so finish the D2H copies here
+        self._stream.synchronize()
+        return results
+    
+    def _stage_batch(self, batch: List[np.ndarray]):
+        """Letterbox into the pinned host buffer and upload into the preallocated device tensor"""
+        import torch
+        
+        size = config.input_size
+        if self._host_buffer is None:
+            shape = (config.max_batch_size, size, size, 3)
+            self._host_buffer = torch.empty(shape, dtype=torch.uint8).pin_memory()
+            self._device_u8 = torch.empty(shape, dtype=torch.uint8, device=self.device)
+            self._device_input = torch.empty((config.max_batch_size, 3, size, size),
+                                             dtype=torch.float16, device=self.device)
+        
+        # Host-decoded arrays go through the pinned buffer; GPU-decoded tensors are letterboxed on device
+        host = self._host_buffer.numpy()
+        letterbox = [
+            letterbox_into(image, host[i]) if isinstance(image, np.ndarray) else None
+            for i, image in enumerate(batch)
+        ]
+        
+        n = len(batch)
+        self._device_u8[:n].copy_(self._host_buffer[:n], non_blocking=True)
+        device_input = self._device_input[:n]
+        device_input.copy_(self._device_u8[:n].permute(0, 3, 1, 2))
+        device_input.div_(255.0)
+        for i, image in enumerate(batch):
+            if letterbox[i] is None:
+                letterbox[i] = letterbox_tensor_into(image, device_input[i])
+        return device_input, letterbox
+    
+    def _stage_batch_cpu(self, batch: List[np.ndarray]):
+        """Letterbox into the reused uint8 buffer, then one fused pass to normalized float32 NCHW
+        
+        The model gets a ready tensor, so ultralytics skips its own letterbox, BGR->RGB,
+        transpose and /255 passes over each image.
+        """
+        import torch
+        
+        size = config.input_size
+        if self._cpu_u8 is None:
+            self._cpu_u8 = np.empty((config.max_batch_size, size, size, 3), dtype=np.uint8)
+            self._cpu_input = np.empty((config.max_batch_size, 3, size, size), dtype=np.float32)
+        
+        n = len(batch)
+        letterbox = [letterbox_into(image, self._cpu_u8[i]) for i, image in enumerate(batch)]
+        cpu_input = self._cpu_input[:n]
+        np.multiply(self._cpu_u8[:n].transpose(0, 3, 1, 2), 1 / 255.0, out=cpu_input, casting="unsafe")
+        return torch.from_numpy(cpu_input), letterbox
+    
+    @staticmethod
+    def _undo_letterbox(results, letterbox):
+        """Map boxes from letterboxed input coordinates back to the original image"""
+        import torch
+        
+        # Result tensors are inference tensors, so in-place edits must stay in inference mode
+        with torch.inference_mode():
+            for result, (scale, pad_x, pad_y) in zip(results, letterbox):
+                if result.boxes is None or len(result.boxes) == 0:
+                    continue
+                xyxy = result.boxes.data[:, :4]
+                xyxy[:, [0, 2]] -= pad_x
+                xyxy[:, [1, 3]] -= pad_y
+                xyxy /= scale
+    
+    async def _infer(self, image: Any):
+        """Run YOLO on one image, through the batching queue when it is running"""
+        if self._batch_queue is None:
+            # Keep the event loop free while the model runs
+            return await asyncio.get_running_loop().run_in_executor(self._infer_pool, self._run_model, image)
+        future = asyncio.get_running_loop().create_future()
+        await self._batch_queue.put((image, future))
+        return await future
+    
     async def analyze_tire_image(self, image_data: Any = None, image_id: str = None) -> TireAnalysisResult:
         """Main analysis method with hybrid processing"""
         if not self.is_initialized:
@@ -326,55 +745,73 @@ class HybridTireDetector:
         image_id = image_id or f"tire_analysis_{int(time.time())}"
         
         try:
-            print(f"🔍 Processing tire analysis: {image_id}")
+            log.debug("analysis start image_id=%s", image_id)
             
             # Attempt real YOLO processing first
             if self.model_loaded and not self.demo_mode and image_data is not None:
-                print("🤖 Using real YOLOv8 processing...")
+                log.debug("yolo inference request image_id=%s", image_id)
                 result = await self._process_with_yolo(image_data, image_id)
                 if result:
                     return result
                 else:
-                    print("🔄 YOLO processing failed, falling back to simulation")
+                    log.info("yolo processing failed, falling back to simulation image_id=%s", image_id)
             
             # Fallback to simulation mode
-            print("🎭 Using simulation mode for reliable demonstration")
+            log.debug("simulation result image_id=%s", image_id)
             return await self.generate_simulation_result()
             
         except Exception as e:
-            print(f"⚠️ Analysis error handled gracefully: {e}")
-            print("🔄 Fallback to simulation mode")
+            log.warning("analysis error, falling back to simulation image_id=%s: %s", image_id, e)
             return await self.generate_simulation_result()
     
     async def _process_with_yolo(self, image_data: bytes, image_id: str) -> Optional[TireAnalysisResult]:
         """Process image with real YOLOv8 model"""
         try:
             if not OPENCV_AVAILABLE:
-                print("⚠️ OpenCV not available for image processing")
+                log.warning("OpenCV not available for image processing")
                 return None
             
-            # Convert bytes to OpenCV image
-            nparr = np.frombuffer(image_data, np.uint8)
-            image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            # Convert bytes to an image off the event loop. GPU decodes touch CUDA, so on cuda
+            # devices they run on the inference thread; CPU decodes use the default executor
+            decode_pool = self._infer_pool if self.device.startswith("cuda") else None
+            image = await asyncio.get_running_loop().run_in_executor(decode_pool, self._decode_image, image_data)
             
             if image is None:
-                print("⚠️ Failed to decode image")
+                log.warning("failed to decode image image_id=%s", image_id)
                 return None
             
             # Run YOLO inference
-            print("🔍 Running YOLO inference...")
-            results = self.model(image, conf=config.confidence_threshold)
+            log.debug("running yolo inference image_id=%s", image_id)
+            start_time = time.perf_counter()
+            results = await self._infer(image)
             
             # Convert YOLO results to our format
             defects = self._convert_yolo_results(results)
+            processing_time = time.perf_counter() - start_time
             
-            # Generate realistic analysis result
-            return await self._generate_yolo_style_results(defects, image_id)
+            # Generate analysis result with the measured processing time
+            return await self._generate_yolo_style_results(defects, image_id, processing_time)
             
         except Exception as e:
-            print(f"⚠️ YOLO processing error: {e}")
+            log.warning("yolo processing error image_id=%s: %s", image_id, e)
             return None
     
+    def _decode_image(self, image_data: bytes) -> Any:
+        """Decode upload bytes: JPEGs to a GPU RGB tensor via nvJPEG, else to a BGR array (OpenCV)"""
+        encoded = np.frombuffer(image_data, np.uint8)
+        is_jpeg = encoded[:2].tobytes() == b"\xff\xd8"
+        if TORCHVISION_AVAILABLE and is_jpeg and self.device.startswith("cuda") and config.preallocate_gpu_buffers:
+            try:
+                import torch
+                from torchvision.io import decode_jpeg
+                
+                # CHW uint8 RGB, already resident on the GPU
+                return decode_jpeg(torch.frombuffer(image_data, dtype=torch.uint8), device=self.device)
+            except Exception as e:
+                log.warning("nvJPEG decode failed, using OpenCV: %s", e)
+        # Full-size BGR array; _run_model letterboxes it into the staging buffers (or ultralytics does)
+        return cv2.imdecode(encoded, cv2.IMREAD_COLOR)
+    
     def _convert_yolo_results(self, results) -> List[DefectResult]:
         """Convert YOLO detection results to our DefectResult format"""
         defects = []
@@ -382,67 +819,49 @@ class HybridTireDetector:
         try:
             for result in results:
                 boxes = result.boxes
-                if boxes is not None:
-                    for box in boxes:
-                        class_id = int(box.cls[0])
-                        confidence = float(box.conf[0])
-                        bbox = box.xyxy[0].tolist()  # [x1, y1, x2, y2]
-                        
-                        # Map YOLO classes to tire defect types
-                        # NOTE: This is general object detection - replace with tire-specific mapping
-                        defect_type = self._map_yolo_class_to_defect(class_id)
-                        severity = "medium" if confidence > 0.7 else "low"
-                        description = f"Detected {defect_type} with {confidence:.1%} confidence"
-                        
-                        defect = DefectResult(
-                            defect_type=defect_type,
-                            confidence=confidence,
-                            bbox=[int(x) for x in bbox],
-                            severity=severity,
-                            description=description
-                        )
-                        defects.append(defect)
+                if boxes is None or len(boxes) == 0:
+                    continue
+                
+                # Pull all boxes across in bulk instead of per-box tensor reads
+                cls_arr = boxes.cls.cpu().numpy().astype(np.int32)
+                conf_arr = boxes.conf.cpu().numpy()
+                xyxy_arr = boxes.xyxy.cpu().numpy().astype(np.int32)
+                
+                # Map YOLO classes to tire defect types through the lookup table
+                # NOTE: This is general object detection - replace with tire-specific mapping
+                unknown_idx = len(self._defect_names) - 1
+                in_range = (cls_arr >= 0) & (cls_arr < len(self._defect_lut))
+                name_idx = np.where(in_range, self._defect_lut[np.clip(cls_arr, 0, len(self._defect_lut) - 1)], unknown_idx)
+                severities = np.where(conf_arr > 0.7, "medium", "low")
+                
+                defect_names = self._defect_names
+                defects.extend(
+                    DefectResult(
+                        defect_type=defect_names[idx],
+                        confidence=confidence,
+                        bbox=bbox,
+                        severity=severity,
+                        description=f"Detected {defect_names[idx]} with {confidence:.1%} confidence"
+                    )
+                    for idx, confidence, bbox, severity in zip(
+                        name_idx.tolist(), conf_arr.tolist(), xyxy_arr.tolist(), severities.tolist()
+                    )
+                )
                         
         except Exception as e:
-            print(f"⚠️ Error converting YOLO results: {e}")
+            log.warning("error converting yolo results: %s", e)
         
         return defects
     
-    def _map_yolo_class_to_defect(self, class_id: int) -> str:
-        """
-        Map YOLO class IDs to tire defect types
-        
-        NOTE: This uses general COCO classes. For production, replace with 
-        tire-specific class mapping from your trained model.
-        """
-        # General COCO class mapping (replace with tire-specific classes)
-        coco_to_defect = {
-            0: "foreign_object",  # person -> foreign object
-            2: "wear_pattern",    # car -> wear pattern  
-            7: "puncture",        # truck -> puncture
-            # Add your tire-specific class mappings here
-        }
-        
-        return coco_to_defect.get(class_id, "unknown_defect")
-    
-    async def _generate_yolo_style_results(self, defects: List[DefectResult], image_id: str) -> TireAnalysisResult:
+    async def _generate_yolo_style_results(self, defects: List[DefectResult], image_id: str,
+                                           processing_time: float) -> TireAnalysisResult:
         """Generate analysis results based on YOLO detections"""
-        processing_time = random.uniform(config.min_processing_time, config.max_processing_time)
-        await asyncio.sleep(min(0.1, processing_time * 0.1))
-        
         # Calculate quality score and safety status
         quality_score = self._calculate_enterprise_quality_score(defects)
         safety_status = self._determine_safety_classification(defects)
         
         # Determine overall quality
-        if quality_score >= 90:
-            overall_quality = "excellent"
-        elif quality_score >= 75:
-            overall_quality = "good" 
-        elif quality_score >= 60:
-            overall_quality = "fair"
-        else:
-            overall_quality = "poor"
+        overall_quality = classify_quality(quality_score)
         
         # Generate recommendations
         recommendations = self._generate_recommendations(defects)
@@ -473,11 +892,8 @@ class HybridTireDetector:
 
     async def generate_enterprise_demo_result(self, scenario: str = None) -> TireAnalysisResult:
         """Generate professional demo results for architecture demonstration"""
-        start_time = time.time()
-        
         # Realistic processing time simulation
-        import random
-        processing_time = random.uniform(config.min_processing_time, config.max_processing_time)
+        processing_time = _rng.uniform(config.min_processing_time, config.max_processing_time)
         
         # Brief delay for presentation realism
         await asyncio.sleep(min(0.15, processing_time * 0.2))
@@ -485,19 +901,18 @@ class HybridTireDetector:
         # Select demonstration scenario
         if scenario and scenario in config.demo_scenarios:
             demo_data = config.demo_scenarios[scenario]
-            print(f"🎭 SIMULATION: Running {scenario} scenario")
+            log.debug("simulation scenario=%s", scenario)
         else:
-            # Weighted random selection (bias toward good outcomes for realism)
-            scenario_weights = ["excellent", "good", "good", "good", "concerning", "critical"]
-            scenario = random.choice(scenario_weights)
+            # Weighted random selection
+            scenario = _rng.choice(_WEIGHTED_SCENARIOS)
             demo_data = config.demo_scenarios[scenario]
-            print(f"🎭 SIMULATION: Running {scenario} scenario")
+            log.debug("simulation scenario=%s (weighted)", scenario)
         
         # Create professional defect objects with realistic variations
         defects = []
         for defect_data in demo_data["defects"]:
             # Add realistic confidence variation (±3%)
-            confidence_variation = random.uniform(-0.03, 0.03) 
+            confidence_variation = _rng.uniform(-0.03, 0.03)
             final_confidence = max(0.50, min(0.99, defect_data["confidence"] + confidence_variation))
             
             defect = DefectResult(
@@ -514,14 +929,7 @@ class HybridTireDetector:
         safety_status = self._determine_safety_classification(defects)
         
         # Determine overall quality classification
-        if quality_score >= 90:
-            overall_quality = "excellent"
-        elif quality_score >= 75:
-            overall_quality = "good"
-        elif quality_score >= 60:
-            overall_quality = "fair"  
-        else:
-            overall_quality = "poor"
+        overall_quality = classify_quality(quality_score)
         
         # Professional recommendations
         recommendations = self._generate_recommendations(defects)
@@ -547,27 +955,25 @@ class HybridTireDetector:
         """Calculate quality score using enterprise-grade algorithms"""
         if not defects:
             # Perfect tire with realistic industrial variation
-            import random
             base_score = 95.0
-            variation = random.uniform(-1.5, 3.0)  # Natural measurement variation
+            variation = _rng.uniform(-1.5, 3.0)  # Natural measurement variation
             return min(100.0, max(90.0, base_score + variation))
         
-        # Industry-standard severity impact matrix
-        severity_deductions = {
-            "low": 5,      # Minor impact on performance
-            "medium": 15,  # Moderate safety/performance impact
-            "high": 30     # Major safety concern
-        }
-        
-        total_deduction = 0
-        for defect in defects:
-            base_deduction = severity_deductions.get(defect.severity, 10)
-            
-            # Size factor (larger defects are worse)
-            size_factor = min(defect.area / 5000, 1.5)  # Cap at 1.5x
-            adjusted_deduction = base_deduction * (1 + size_factor * 0.3)
-            
-            total_deduction += adjusted_deduction
+        if NUMBA_AVAILABLE and len(defects) >= NUMBA_MIN_DEFECTS:
+            arr = np.empty((len(defects), 2), dtype=np.float32)
+            arr[:, 0] = [SEVERITY_CODES.get(d.severity, 3) for d in defects]
+            arr[:, 1] = [d.area for d in defects]
+            total_deduction = _score_arr(arr, SEVERITY_DEDUCTIONS_ARR)
+        else:
+            total_deduction = 0
+            for defect in defects:
+                base_deduction = SEVERITY_DEDUCTIONS[SEVERITY_CODES.get(defect.severity, 3)]
+                
+                # Size factor (larger defects are worse)
+                size_factor = min(defect.area / 5000, 1.5)  # Cap at 1.5x
+                adjusted_deduction = base_deduction * (1 + size_factor * 0.3)
+                
+                total_deduction += adjusted_deduction
         
         # Multiple defect penalty (compound risk)
         if len(defects) > 2:
@@ -582,18 +988,21 @@ class HybridTireDetector:
         if not defects:
             return "safe"
         
+        # Count severities in a single pass (index 3 collects unrecognised values)
+        counts = [0, 0, 0, 0]
+        for d in defects:
+            counts[SEVERITY_CODES.get(d.severity, 3)] += 1
+        low_severity_count, medium_severity_count, high_severity_count, _ = counts
+        
         # Check for high severity defects
-        high_severity_count = sum(1 for d in defects if d.severity == "high")
         if high_severity_count >= 1:
             return "unsafe"
         
         # Check for multiple medium severity
-        medium_severity_count = sum(1 for d in defects if d.severity == "medium")
         if medium_severity_count >= 3:
             return "caution"
         
         # Multiple low severity might indicate wear pattern
-        low_severity_count = sum(1 for d in defects if d.severity == "low")
         if low_severity_count >= 5:
             return "monitor"
         
@@ -646,20 +1055,53 @@ class HybridTireDetector:
 
 # ==================== FastAPI Application ====================
 
+def inference_devices() -> List[str]:
+    """Devices to serve on: every visible GPU when config.device is a bare 'cuda', else just config.device"""
+    if config.device != "cuda" or importlib.util.find_spec("torch") is None:
+        return [config.device]
+    import torch
+    count = torch.cuda.device_count()
+    return [f"cuda:{i}" for i in range(count)] if count > 1 else [config.device]
+
+def configure_torch_backends():
+    """Let cuDNN autotune conv kernels for the fixed letterbox size and use TF32 on Ampere+"""
+    if not (YOLO_AVAILABLE and config.fast_cuda_math) or importlib.util.find_spec("torch") is None:
+        return
+    import torch
+    if not torch.cuda.is_available():
+        return
+    torch.backends.cuda.matmul.allow_tf32 = True
+    torch.backends.cudnn.allow_tf32 = True
+    torch.backends.cudnn.benchmark = True
+    torch.set_float32_matmul_precision("high")
+    print("⚡ TF32 + cuDNN benchmark enabled")
+
+def least_loaded_detector() -> "HybridTireDetector":
+    """Pick the detector with the shortest batching queue"""
+    return min(detectors, key=lambda instance: instance.queue_depth())
+
 # Create FastAPI application with modern lifespan handler  
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handle application startup and shutdown events"""
-    # Startup: Initialize the detector
+    # Startup: Initialize one detector per inference device
     print("🔧 Initializing RUBICON Tire Detection System...")
-    global detector
-    detector = HybridTireDetector()
-    await detector.initialize()
+    global detector, detectors
+    configure_torch_backends()
+    detectors = [HybridTireDetector(device) for device in inference_devices()]
+    for instance in detectors:
+        await instance.initialize()
+        instance.start_batching()
+    detector = detectors[0]
+    if len(detectors) > 1:
+        print(f"🖥️ Serving on {len(detectors)} devices: {', '.join(d.device for d in detectors)}")
     print("✅ System ready for tire analysis")
     
     yield
     
     # Shutdown: Cleanup if needed
+    for instance in detectors:
+        await instance.stop_batching()
     print("🔄 RUBICON system shutdown complete")
 
 app = FastAPI(
@@ -687,12 +1129,34 @@ app = FastAPI(
     lifespan=lifespan
 )
 
-# Global detector instance (initialized in lifespan)
+# Global detector instances (initialized in lifespan); `detector` is the primary one
 detector = None
+detectors: List[HybridTireDetector] = []
 
 
 # ==================== API Endpoints ====================
 
+def analysis_response(result: TireAnalysisResult) -> Response:
+    """Serialize an analysis result straight to JSON bytes, bypassing FastAPI's response_model pass"""
+    if MSGSPEC_AVAILABLE:
+        body = msgspec.json.encode(result.__dict__)
+    else:
+        body = result.model_dump_json().encode()
+    return Response(content=body, media_type="application/json")
+
+async def read_upload_limited(upload: UploadFile, limit: int) -> bytearray:
+    """Read an upload in chunks into one buffer, rejecting it as soon as it exceeds limit"""
+    if upload.size is not None and upload.size > limit:
+        raise HTTPException(status_code=413, detail=f"Image exceeds {limit // (1024 * 1024)}MB limit")
+    
+    buffer = bytearray()
+    while chunk := await upload.read(config.upload_chunk_size):
+        buffer += chunk
+        if len(buffer) > limit:
+            raise HTTPException(status_code=413, detail=f"Image exceeds {limit // (1024 * 1024)}MB limit")
+    return buffer
+
+
 @app.post("/analyze", response_model=TireAnalysisResult)
 async def analyze_tire(
     image: UploadFile = File(..., description="Tire image to analyze"),
@@ -713,6 +1177,11 @@ async def analyze_tire(
     if not detector:
         raise HTTPException(status_code=503, detail="System not properly initialized")
     
+    # Route to the least busy device; shed load rather than queue past the SLA
+    target = least_loaded_detector()
+    if target.is_overloaded():
+        raise HTTPException(status_code=429, detail="Inference queue full - retry shortly")
+    
     # Validate file type
     allowed_types = ["image/jpeg", "image/png", "image/jpg", "image/webp"]
     if image.content_type not in allowed_types:
@@ -721,24 +1190,25 @@ async def analyze_tire(
             detail=f"Invalid file type. Allowed: {', '.join(allowed_types)}"
         )
     
+    # Read image data (size-checked; decoded later straight from this buffer)
+    image_data = await read_upload_limited(image, config.max_upload_bytes)
+    
     try:
-        # Read image data
-        image_data = await image.read()
         image_id = f"upload_{int(time.time())}"
         
-        print(f"🖼️ Processing image: {image.filename} ({len(image_data)} bytes)")
+        log.debug("upload filename=%s bytes=%d", image.filename, len(image_data))
         
         # Process with hybrid detector
         if scenario:
-            print(f"🎭 Using scenario: {scenario}")
-            result = await detector.generate_simulation_result(scenario)
+            log.debug("upload scenario=%s", scenario)
+            result = await target.generate_simulation_result(scenario)
         else:
-            result = await detector.analyze_tire_image(image_data, image_id)
+            result = await target.analyze_tire_image(image_data, image_id)
         
-        return result
+        return analysis_response(result)
         
     except Exception as e:
-        print(f"❌ Analysis error: {e}")
+        log.exception("analysis error: %s", e)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
@@ -756,9 +1226,9 @@ async def analyze_demo(scenario: Optional[str] = Query("good", description="Demo
     
     try:
         result = await detector.generate_simulation_result(scenario)
-        return result
+        return analysis_response(result)
     except Exception as e:
-        print(f"❌ Demo generation error: {e}")
+        log.exception("demo generation error: %s", e)
         raise HTTPException(status_code=500, detail=f"Demo failed: {str(e)}")
 
 
@@ -773,6 +1243,12 @@ async def health_check():
     }
 
 
+@app.head("/health", include_in_schema=False)
+async def health_probe():
+    """Liveness probe: bare 200 with no body to build or encode"""
+    return Response(status_code=200)
+
+
 # ==================== Main Application Entry Point ====================
 
 if __name__ == "__main__":